@@ -351,6 +351,15 @@ def kikuchipy_h5ebsd_path() -> Generator[Path, None, None]:
     yield DATA_PATH / "kikuchipy_h5ebsd"
 
 
+@pytest.fixture(scope="session")
+def kikuchipy_h5ebsd_signal() -> Generator[kp.signals.EBSD, None, None]:
+    """Signal read once per test session from the kikuchipy h5ebsd file.
+
+    Tests must use a copy, since the signal is shared between tests.
+    """
+    yield kp.load(DATA_PATH / "kikuchipy_h5ebsd/patterns.h5")
+
+
 @pytest.fixture
 def nickel_ebsd_large_h5ebsd_renamed() -> Generator[Path, None, None]:
     f1 = Path(marshall.path) / "data/nickel_ebsd_large/patterns.h5"
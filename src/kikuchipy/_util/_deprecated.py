@@ -33,6 +33,25 @@ import warnings
 
 import numpy as np
 
+_NOTES_HEADER = "\nNotes\n-----"
+
+
+def _deprecation_warnings_ignored() -> bool:
+    """Return whether the active warning filters ignore all
+    :class:`~numpy.VisibleDeprecationWarning`, meaning decorated
+    functions need not be wrapped.
+    """
+    for action, message, category, module, lineno in warnings.filters:
+        if not issubclass(np.VisibleDeprecationWarning, category):
+            continue
+        if message is None and module is None and lineno == 0:
+            return action == "ignore"
+        # A filter restricted to some messages or modules may still let
+        # the warning through
+        if action != "ignore":
+            return False
+    return False
+
 
 class deprecated:
     """Decorator to mark deprecated functions with an informative
@@ -90,29 +109,45 @@ class deprecated:
         else:
             msg = f"Attribute `{func.__name__}` is deprecated{rm_msg}.{alt_msg}"
 
-        @functools.wraps(func)
-        def wrapped(*args, **kwargs) -> Callable:
-            warnings.simplefilter(
-                action="always", category=np.VisibleDeprecationWarning, append=True
-            )
-            func_code = func.__code__
-            warnings.warn_explicit(
-                message=msg,
-                category=np.VisibleDeprecationWarning,
-                filename=func_code.co_filename,
-                lineno=func_code.co_firstlineno + 1,
-            )
-            return func(*args, **kwargs)
-
         # Modify docstring to display deprecation warning
-        old_doc = inspect.cleandoc(func.__doc__ or "").strip("\n")
-        notes_header = "\nNotes\n-----"
+        if func.__doc__:
+            old_doc = inspect.cleandoc(func.__doc__).strip("\n")
+            has_notes = _NOTES_HEADER in old_doc
+        else:
+            old_doc = ""
+            has_notes = False
         new_doc = (
             f"[*Deprecated*] {old_doc}\n"
-            f"{notes_header if notes_header not in old_doc else ''}\n"
+            f"{'' if has_notes else _NOTES_HEADER}\n"
             f".. deprecated:: {self.since}\n"
-            f"   {msg.strip()}"  # Matplotlib uses three spaces
+            f"   {msg}"  # Matplotlib uses three spaces
         )
+
+        # Skip the wrapper if the warning would be ignored anyway
+        if _deprecation_warnings_ignored():
+            func.__doc__ = new_doc
+            return func
+
+        func_code = func.__code__
+        filename = func_code.co_filename
+        lineno = func_code.co_firstlineno + 1
+
+        # Only warn the first time the function is called
+        warned = False
+
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs) -> Callable:
+            nonlocal warned
+            if not warned:
+                warned = True
+                warnings.warn_explicit(
+                    message=msg,
+                    category=np.VisibleDeprecationWarning,
+                    filename=filename,
+                    lineno=lineno,
+                )
+            return func(*args, **kwargs)
+
         wrapped.__doc__ = new_doc
 
         return wrapped
@@ -139,26 +174,35 @@ class deprecated_argument:
         self.alternative = alternative
 
     def __call__(self, func: Callable) -> Callable:
+        if _deprecation_warnings_ignored():
+            return func
+
+        name = self.name
+        msg = (
+            f"Parameter `{name}` is deprecated and will be removed in version "
+            f"{self.removal}. To avoid this warning, please do not use `{name}`. "
+        )
+        if self.alternative is not None:
+            msg += f"Use `{self.alternative}` instead. "
+        msg += f"See the documentation of `{func.__name__}()` for more details."
+
+        func_code = func.__code__
+        filename = func_code.co_filename
+        lineno = func_code.co_firstlineno + 1
+
+        # Only warn the first time the argument is passed
+        warned = False
+
         @functools.wraps(func)
         def wrapped(*args, **kwargs):
-            if self.name in kwargs.keys():
-                msg = (
-                    f"Parameter `{self.name}` is deprecated and will be removed in "
-                    f"version {self.removal}. To avoid this warning, please do not use "
-                    f"`{self.name}`. "
-                )
-                if self.alternative is not None:
-                    msg += f"Use `{self.alternative}` instead. "
-                msg += f"See the documentation of `{func.__name__}()` for more details."
-                warnings.simplefilter(
-                    action="always", category=np.VisibleDeprecationWarning
-                )
-                func_code = func.__code__
+            nonlocal warned
+            if kwargs and not warned and name in kwargs:
+                warned = True
                 warnings.warn_explicit(
                     message=msg,
                     category=np.VisibleDeprecationWarning,
-                    filename=func_code.co_filename,
-                    lineno=func_code.co_firstlineno + 1,
+                    filename=filename,
+                    lineno=lineno,
                 )
             return func(*args, **kwargs)
 
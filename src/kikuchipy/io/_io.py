@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with kikuchipy. If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import glob
 import os
 from pathlib import Path
@@ -27,7 +28,7 @@ from hyperspy.misc.utils import find_subclasses, strlist2enumeration
 from hyperspy.signal import BaseSignal
 import numpy as np
 
-from kikuchipy.io._util import _ensure_directory, _get_input_bool
+from kikuchipy.io._util import _ensure_directory, _get_input_bool, _is_hdf5
 from kikuchipy.io.plugins import (
     bruker_h5ebsd,
     ebsd_directory,
@@ -70,10 +71,22 @@ if TYPE_CHECKING:  # pragma: no cover
     )
     from kikuchipy.signals.ecp_master_pattern import ECPMasterPattern
 
-default_write_ext = set()
+# Look-up of readers and writer per file extension. The first writing
+# plugin listed above takes precedence.
+_ext_to_readers: dict[str, list] = {}
+_ext_to_writer: dict[str, object] = {}
 for plugin in plugins:
-    if plugin.writes:
-        default_write_ext.add(plugin.file_extensions[plugin.default_extension])
+    for ext in plugin.file_extensions:
+        ext = ext.lower()
+        _ext_to_readers.setdefault(ext, []).append(plugin)
+        if plugin.writes:
+            _ext_to_writer.setdefault(ext, plugin)
+
+default_write_ext = frozenset(
+    plugin.file_extensions[plugin.default_extension]
+    for plugin in plugins
+    if plugin.writes
+)
 
 
 def load(
@@ -120,25 +133,31 @@ def load(
     filename = str(filename)
 
     if not os.path.isfile(filename):
-        is_wildcard = False
-        filenames = glob.glob(filename)
-        if len(filenames) > 0:
-            is_wildcard = True
-        if not is_wildcard:
+        is_wildcard = any(c in filename for c in "*?[")
+        if is_wildcard:
+            # Stop at the first file matching a wildcard pattern
+            no_match = next(glob.iglob(filename), None) is None
+        else:
+            # Paths which exist but are not files, e.g. directories, are
+            # reported as unreadable below
+            no_match = not os.path.exists(filename)
+        if no_match:
             raise IOError(f"No filename matches {filename!r}")
 
+    directory, basename = os.path.split(os.path.abspath(filename))
+    stem, extension = os.path.splitext(basename)
+    extension = extension[1:]
+
     # Find matching reader for file extension
-    extension = os.path.splitext(filename)[1][1:]
-    readers = []
-    for plugin in plugins:
-        if extension.lower() in plugin.file_extensions:
-            readers.append(plugin)
+    readers = _ext_to_readers.get(extension.lower(), [])
     if len(readers) == 0:
         raise IOError(
             f"Could not read {filename!r}. If the file format is supported, please "
             "report this error"
         )
-    elif len(readers) > 1 and h5py.is_hdf5(filename):
+    elif len(readers) == 1:
+        reader = readers[0]
+    elif _is_hdf5(filename):
         reader = _plugin_from_footprints(filename, plugins=readers)
     else:
         reader = readers[0]
@@ -149,11 +168,9 @@ def load(
     out = []
     for signal in signal_dicts:
         out.append(_dict2signal(signal, lazy=lazy))
-        directory, filename = os.path.split(os.path.abspath(filename))
-        filename, extension = os.path.splitext(filename)
         out[-1].tmp_parameters.folder = directory
-        out[-1].tmp_parameters.filename = filename
-        out[-1].tmp_parameters.extension = extension.replace(".", "")
+        out[-1].tmp_parameters.filename = stem
+        out[-1].tmp_parameters.extension = extension
 
     if len(out) == 1:
         out = out[0]
@@ -235,26 +252,24 @@ def _plugin_from_footprints(filename: str, plugins) -> object:
         found.
     """
 
-    def _hdf5group2dict(group):
-        d = {}
-        for key, val in group.items():
-            key_lower = key.lstrip().lower()
-            if isinstance(val, h5py.Group):
-                d[key_lower] = _hdf5group2dict(val)
-            elif key_lower == "manufacturer":
-                d[key_lower] = key
-            else:
-                d[key_lower] = 1
-        return d
-
-    def _exists(obj, chain):
-        key = chain.pop(0)
-        if key in obj:
-            return _exists(obj[key], chain) if chain else obj[key]
-
-    with h5py.File(filename) as f:
-        d = _hdf5group2dict(f["/"])
-
+    def _lower_keys(group: h5py.Group) -> dict[str, str]:
+        return {key.lstrip().lower(): key for key in group.keys()}
+
+    def _exists(group: h5py.Group, chain: tuple[str, ...]) -> bool:
+        obj = group
+        for key in chain:
+            if not isinstance(obj, h5py.Group):
+                return False
+            keys = _lower_keys(obj)
+            if key not in keys:
+                return False
+            obj = obj[keys[key]]
+        return True
+
+    # Open read-only without a chunk cache, since no data is read. File
+    # locking is not disabled, since HDF5 then refuses to open a file
+    # already opened elsewhere with locking, e.g. by a lazy signal.
+    with h5py.File(filename, mode="r", rdcc_nbytes=0) as f:
         plugins_with_footprints = [p for p in plugins if hasattr(p, "footprint")]
         plugins_with_manufacturer = [
             p for p in plugins_with_footprints if hasattr(p, "manufacturer")
@@ -262,35 +277,39 @@ def _plugin_from_footprints(filename: str, plugins) -> object:
 
         matching_plugin = None
         # Check manufacturer if possible (all h5ebsd files have this)
-        for key, val in d.items():
-            if key == "manufacturer":
-                # Extracting the manufacturer is finicky
-                man = f[val][()]
-                if isinstance(man, np.ndarray) and len(man) == 1:
-                    man = man[0]
-                if isinstance(man, bytes):
-                    man = man.decode("latin-1")
-                for p in plugins_with_manufacturer:
-                    if man.lower() == p.manufacturer:
-                        matching_plugin = p
-                        break
+        top_keys = _lower_keys(f)
+        if "manufacturer" in top_keys and isinstance(
+            f[top_keys["manufacturer"]], h5py.Dataset
+        ):
+            # Extracting the manufacturer is finicky
+            man = f[top_keys["manufacturer"]][()]
+            if isinstance(man, np.ndarray) and len(man) == 1:
+                man = man[0]
+            if isinstance(man, bytes):
+                man = man.decode("latin-1")
+            for p in plugins_with_manufacturer:
+                if man.lower() == p.manufacturer:
+                    matching_plugin = p
+                    break
 
         # If no match found, continue searching
         if matching_plugin is None:
             for p in plugins_with_footprints:
-                n_matches = 0
-                n_desired_matches = len(p.footprint)
-                for fp in p.footprint:
-                    fp = fp.lower().split("/")
-                    if _exists(d, fp) is not None:
-                        n_matches += 1
-                if n_matches == n_desired_matches:
+                if all(_exists(f, fp) for fp in _split_footprint(p)):
                     matching_plugin = p
                     break
 
     return matching_plugin
 
 
+@functools.cache
+def _split_footprint(plugin) -> tuple[tuple[str, ...], ...]:
+    """Return a plugin's HDF5 footprint as lower case group/dataset
+    names per nested level.
+    """
+    return tuple(tuple(fp.lower().split("/")) for fp in plugin.footprint)
+
+
 def _assign_signal_subclass(
     dtype: np.dtype,
     signal_dimension: int,
@@ -321,13 +340,8 @@ def _assign_signal_subclass(
     Signal or subclass
     """
     # Check if parameter values are allowed
-    if (
-        "float" in dtype.name
-        or "int" in dtype.name
-        or "void" in dtype.name
-        or "bool" in dtype.name
-        or "object" in dtype.name
-    ):
+    # Floating point, (unsigned) integer, void, boolean or object
+    if dtype.kind in "fiuVbO":
         dtype = "real"
     else:
         raise ValueError(f"Data type {dtype.name!r} not understood")
@@ -337,31 +351,38 @@ def _assign_signal_subclass(
         )
 
     # Get possible signal classes
-    signals = {}
-    for k, v in find_subclasses(kikuchipy.signals, BaseSignal).items():
-        if v._lazy == lazy:
-            signals[k] = v
-
-    # Get signals matching both input signal's dtype and signal dimension
-    dtype_matches = [s for s in signals.values() if s._dtype == dtype]
-    dtype_dim_matches = [
-        s for s in dtype_matches if s._signal_dimension == signal_dimension
-    ]
-    dtype_dim_type_matches = [
-        s
-        for s in dtype_dim_matches
-        if signal_type == s._signal_type or signal_type in s._alias_signal_types
-    ]
-
-    if len(dtype_dim_type_matches) == 1:
-        matches = dtype_dim_type_matches
-    else:
+    signals = _signal_classes(lazy)
+
+    # Get the signal matching the input signal's dtype, signal dimension
+    # and signal type
+    match = next(
+        (
+            s
+            for s in signals
+            if s._dtype == dtype
+            and s._signal_dimension == signal_dimension
+            and (signal_type == s._signal_type or signal_type in s._alias_signal_types)
+        ),
+        None,
+    )
+    if match is None:
         raise ValueError(
             f"No kikuchipy signals match dtype {dtype!r}, signal dimension "
             f"'{signal_dimension}' and signal_type {signal_type!r}"
         )
 
-    return matches[0]
+    return match
+
+
+@functools.cache
+def _signal_classes(lazy: bool) -> tuple[type, ...]:
+    """Return kikuchipy's signal classes which are either lazy or not.
+
+    The classes are only searched for the first time this function is
+    called, since this is slow.
+    """
+    signals = find_subclasses(kikuchipy.signals, BaseSignal).values()
+    return tuple(s for s in signals if s._lazy == lazy)
 
 
 def _save(
@@ -397,12 +418,7 @@ def _save(
         ext = "h5"
         filename = filename + "." + ext
 
-    writer = None
-    for plugin in plugins:
-        if ext.lower() in plugin.file_extensions and plugin.writes:
-            writer = plugin
-            break
-
+    writer = _ext_to_writer.get(ext.lower())
     if writer is None:
         raise ValueError(
             f"{ext!r} does not correspond to any supported format. Supported file "
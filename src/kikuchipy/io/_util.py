@@ -78,3 +78,26 @@ def _ensure_directory(filename: str) -> None:
     directory = os.path.split(filename)[0]
     if directory and not os.path.exists(directory):
         os.makedirs(directory)
+
+
+def _is_hdf5(filename: str) -> bool:
+    """Return whether a file is an HDF5 file by looking for the HDF5
+    file signature.
+
+    This is cheaper than :func:`h5py.is_hdf5`, which opens the file with
+    the HDF5 library. The signature is found at byte 0, or at byte 512,
+    1024, 2048 and so on if the file has a user block.
+    """
+    try:
+        with open(filename, "rb") as f:
+            offset = 0
+            while True:
+                f.seek(offset)
+                signature = f.read(8)
+                if len(signature) < 8:
+                    return False
+                elif signature == b"\x89HDF\r\n\x1a\n":
+                    return True
+                offset = 512 if offset == 0 else 2 * offset
+    except OSError:
+        return False
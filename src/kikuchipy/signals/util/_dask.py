@@ -15,10 +15,14 @@
 # You should have received a copy of the GNU General Public License
 # along with kikuchipy. If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import logging
+import math
 from typing import TYPE_CHECKING
 
+import dask
 import dask.array as da
+from dask.utils import parse_bytes
 import numpy as np
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -26,6 +30,10 @@ if TYPE_CHECKING:  # pragma: no cover
 
 _logger = logging.getLogger(__name__)
 
+# Size of learning results chunks in MB, as suggested in the Dask
+# documentation
+LEARNING_RESULTS_MBYTES_CHUNK = 100
+
 
 def get_chunking(
     signal: "EBSD | LazyEBSD | None" = None,
@@ -79,27 +87,71 @@ def get_chunking(
         Chunk tuple.
     """
     if signal is not None:
-        data_shape = signal.data.shape
-        nav_dim = signal.axes_manager.navigation_dimension
-        sig_dim = signal.axes_manager.signal_dimension
+        data = signal.data
+        axes_manager = signal.axes_manager
+        data_shape = data.shape
+        nav_dim = axes_manager.navigation_dimension
+        sig_dim = axes_manager.signal_dimension
     if dtype is None:
-        dtype = signal.data.dtype
-    else:
+        dtype = data.dtype
+    elif not isinstance(dtype, np.dtype):
         dtype = np.dtype(dtype)
 
-    chunks_dict = {}
-    # Set the desired navigation chunk shape
-    for i in range(nav_dim):
-        if chunk_shape is None:
-            chunks_dict[i] = "auto"
-        else:
-            chunks_dict[i] = chunk_shape
-    # Don't chunk the signal shape
-    for i in range(nav_dim, nav_dim + sig_dim):
-        chunks_dict[i] = -1
+    if isinstance(chunk_shape, (int, np.integer)) and chunk_shape > 0:
+        # The chunk size limit is ignored, so set the desired navigation
+        # chunk shape directly, but don't chunk the signal shape
+        chunk_shape = int(chunk_shape)
+        nav_chunks = tuple(
+            (chunk_shape,) * (size // chunk_shape)
+            + ((size % chunk_shape,) if size % chunk_shape else ())
+            or (size,)
+            for size in data_shape[:nav_dim]
+        )
+        sig_chunks = tuple((size,) for size in data_shape[nav_dim:])
+        return nav_chunks + sig_chunks
+
+    if chunk_bytes is None:
+        # Resolve Dask's default chunk size here so that cached chunks
+        # follow changes to the configuration
+        chunk_bytes = dask.config.get("array.chunk-size")
+    if isinstance(chunk_bytes, str):
+        # Equal sizes, e.g. "30 MB" and "30MB", give the same cache key
+        chunk_bytes = parse_bytes(chunk_bytes)
+
+    if chunk_shape is not None:
+        # Let Dask validate and normalize other chunk shapes, e.g.
+        # "auto", -1 or per-axis chunks. These are not cached, since
+        # they may not be hashable.
+        chunks = da.core.normalize_chunks(
+            chunks=(chunk_shape,) * nav_dim + (-1,) * sig_dim,
+            shape=data_shape,
+            limit=chunk_bytes,
+            dtype=dtype,
+        )
+        return chunks
+
+    return _normalize_chunks_cached(
+        tuple(data_shape), nav_dim, sig_dim, chunk_bytes, dtype
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_chunks_cached(
+    data_shape: tuple[int, ...],
+    nav_dim: int,
+    sig_dim: int,
+    chunk_bytes: int | float,
+    dtype: np.dtype,
+) -> tuple:
+    """Return automatic chunks from :func:`get_chunking`, cached since
+    the same data is often chunked many times.
+    """
+    # Chunk the navigation shape automatically, but don't chunk the
+    # signal shape
+    chunks_arg = ("auto",) * nav_dim + (-1,) * sig_dim
 
     chunks = da.core.normalize_chunks(
-        chunks=chunks_dict,
+        chunks=chunks_arg,
         shape=data_shape,
         limit=chunk_bytes,
         dtype=dtype,
@@ -132,12 +184,13 @@ def get_dask_array(
         Dask array with signal data with appropriate chunking and data
         type.
     """
+    data = signal.data
     if dtype is None:
-        dtype = signal.data.dtype
-    else:
+        dtype = data.dtype
+    elif not isinstance(dtype, np.dtype):
         dtype = np.dtype(dtype)
-    if signal._lazy or isinstance(signal.data, da.Array):
-        dask_array = signal.data
+    if signal._lazy or isinstance(data, da.Array):
+        dask_array = data
         if kwargs.pop("rechunk", False):
             new_chunks = _reduce_chunks(
                 dask_array=dask_array,
@@ -153,45 +206,79 @@ def get_dask_array(
             chunk_shape=kwargs.pop("chunk_shape", None),
             chunk_bytes=kwargs.pop("chunk_bytes", None),
         )
-        dask_array = da.from_array(signal.data, chunks=chunks)
-    return dask_array.astype(dtype)
+        dask_array = da.from_array(data, chunks=chunks)
+    if dask_array.dtype != dtype:
+        dask_array = dask_array.astype(dtype)
+    return dask_array
 
 
 def _reduce_chunks(
     dask_array: da.Array,
-    chunk_bytes: int | float = 8e6,
+    chunk_bytes: int | float | str = 8e6,
     dtype_out: str | np.dtype | type = "float32",
 ) -> tuple:
-    dtype_out = np.dtype(dtype_out)
+    if isinstance(chunk_bytes, str):
+        chunk_bytes = parse_bytes(chunk_bytes)
+    if not isinstance(dtype_out, np.dtype):
+        dtype_out = np.dtype(dtype_out)
 
     chunksize = dask_array.chunksize
     nav_chunksize = chunksize[:-2]
     nav_ndim = len(nav_chunksize)
-    chunks_dict = {i: "auto" for i in range(nav_ndim)}
-    chunks_dict.update({i: -1 for i in range(nav_ndim, nav_ndim + 2)})
 
+    # Keep the source chunks along the signal axes and, if it is small
+    # enough, along the navigation axis with the smallest chunks
+    keep = [False] * nav_ndim + [True, True]
     if nav_ndim == 2:
-        idx_min = np.argmin(nav_chunksize)
-        if nav_chunksize[idx_min] * np.prod(chunksize[-2:]) * 4 < chunk_bytes:
-            chunks_dict[idx_min] = -1
+        idx_min = 0 if nav_chunksize[0] <= nav_chunksize[1] else 1
+        if nav_chunksize[idx_min] * chunksize[-2] * chunksize[-1] * 4 < chunk_bytes:
+            keep[idx_min] = True
     chunks = da.core.normalize_chunks(
-        chunks=chunks_dict,
+        chunks=tuple(-1 if k else "auto" for k in keep),
         shape=dask_array.shape,
         limit=chunk_bytes,
         dtype=dtype_out,
     )
 
     old_chunks = dask_array.chunks
-    new_chunks = ()
-    for i in range(len(chunksize)):
-        if chunks_dict[i] == -1:
-            new_chunks += (old_chunks[i],)
-        else:
-            new_chunks += (chunks[i],)
+    new_chunks = tuple(
+        old_chunks[i] if keep[i] else _snap_chunks(chunks[i], old_chunks[i])
+        for i in range(len(chunksize))
+    )
 
     return new_chunks
 
 
+def _snap_chunks(chunks: tuple, old_chunks: tuple) -> tuple:
+    """Return chunks along one axis with sizes snapped down to a
+    multiple of the old, regular, chunk size, so that old chunks are
+    merged but not split when rechunking.
+
+    The chunks are returned unchanged if the old chunks are irregular or
+    larger than the new chunks, or if snapping would give more chunks.
+    """
+    old_size = old_chunks[0]
+    new_size = chunks[0]
+    size = sum(old_chunks)
+    is_regular = old_chunks[-1] <= old_size and all(
+        c == old_size for c in old_chunks[:-1]
+    )
+    if new_size < old_size or new_size >= size or not is_regular:
+        return chunks
+    snapped_size = new_size - new_size % old_size
+    n, remainder = divmod(size, snapped_size)
+    snapped_chunks = (snapped_size,) * n
+    if remainder:
+        if snapped_size + remainder <= new_size:
+            # Merge the remainder into the last chunk
+            snapped_chunks = snapped_chunks[:-1] + (snapped_size + remainder,)
+        else:
+            snapped_chunks += (remainder,)
+    if len(snapped_chunks) > len(chunks):
+        return chunks
+    return snapped_chunks
+
+
 def _get_chunk_overlap_depth(window, axes_manager, chunksize: tuple) -> dict:
     """Return overlap depth between navigation chunks equal to the max.
     number of nearest neighbours in each navigation axis.
@@ -208,15 +295,21 @@ def _get_chunk_overlap_depth(window, axes_manager, chunksize: tuple) -> dict:
     """
     sig_dim = axes_manager.signal_dimension
     nav_shape = axes_manager.navigation_shape[::-1]
-    is_chunked = ~np.equal(chunksize[:-sig_dim], nav_shape)
-    overlap_depth = {i: n for i, n in enumerate(window.n_neighbours) if is_chunked[i]}
+    nav_chunksize = chunksize[:-sig_dim]
+    overlap_depth = {
+        i: n
+        for i, (n, cs, ns) in enumerate(
+            zip(window.n_neighbours, nav_chunksize, nav_shape)
+        )
+        if cs != ns
+    }
     return overlap_depth
 
 
 def _rechunk_learning_results(
     factors: np.ndarray | da.Array,
     loadings: np.ndarray | da.Array,
-    mbytes_chunk: int | float = 100,
+    mbytes_chunk: int | float = LEARNING_RESULTS_MBYTES_CHUNK,
 ) -> list:
     """Return suggested data chunks for learning results.
 
@@ -254,29 +347,78 @@ def _rechunk_learning_results(
 
     # Determine maximum number of (strictly necessary) chunks
     suggested_size = mbytes_chunk * 2**20
-    factors_size = factors.nbytes
-    loadings_size = loadings.nbytes
+    factors_size = math.prod(factors.shape) * factors.dtype.itemsize
+    loadings_size = math.prod(loadings.shape) * loadings.dtype.itemsize
     total_size = factors_size + loadings_size
-    num_chunks = np.ceil(total_size / suggested_size)
+    if total_size <= suggested_size:
+        return [(-1, -1), (-1, -1)]
+    num_chunks = math.ceil(total_size / suggested_size)
 
     # Get chunk sizes
     if factors_size <= suggested_size:  # Chunk first axis in loadings
-        chunks = [(-1, -1), (int(learning_results_shape[2] / num_chunks), -1)]
+        chunks = [(-1, -1), (learning_results_shape[2] // num_chunks, -1)]
     else:  # Chunk both first axes
-        sizes = [factors_size, loadings_size]
-        while (sizes[0] + sizes[1]) >= suggested_size:
-            max_idx = int(np.argmax(sizes))
-            sizes[max_idx] = np.floor(sizes[max_idx] / 2)
-        factors_chunks = int(np.ceil(factors_size / sizes[0]))
-        loadings_chunks = int(np.ceil(loadings_size / sizes[1]))
+        n_halvings = _get_number_of_halvings(
+            [factors_size, loadings_size], suggested_size
+        )
+        factors_chunks = math.ceil(factors_size / (factors_size >> n_halvings[0]))
+        loadings_chunks = math.ceil(loadings_size / (loadings_size >> n_halvings[1]))
         chunks = [
-            (int(learning_results_shape[0] / factors_chunks), -1),
-            (int(learning_results_shape[2] / loadings_chunks), -1),
+            (learning_results_shape[0] // factors_chunks, -1),
+            (learning_results_shape[2] // loadings_chunks, -1),
         ]
 
     return chunks
 
 
+def _get_number_of_halvings(sizes: list[int], max_size: int | float) -> list[int]:
+    """Return how many times each of two sizes must be halved for
+    their sum to be smaller than a maximum size.
+
+    The largest size is halved until the sum is small enough, with ties
+    resolved in favour of the first size. This is solved directly
+    instead of halving in a loop: the larger size is first halved until
+    it is the smaller, after which the two are halved in turn.
+    """
+    big = 0 if sizes[0] >= sizes[1] else 1
+    small = 1 - big
+    n_halvings = [0, 0]
+
+    # Halve the larger size until it is smaller, or until the sum is
+    # small enough
+    n_big = _min_halvings(sizes[big] / sizes[small], strict=big == 0)
+    if sizes[small] < max_size:
+        n_fit = _min_halvings(sizes[big] / (max_size - sizes[small]))
+        if n_fit <= n_big:
+            n_halvings[big] = n_fit
+            return n_halvings
+    n_halvings[big] = n_big
+
+    # Halve the two sizes in turn, starting with the now larger size
+    current = [sizes[0] / 2 ** n_halvings[0], sizes[1] / 2 ** n_halvings[1]]
+    first = 0 if current[0] >= current[1] else 1
+    second = 1 - first
+    n_pairs_even = _min_halvings((current[first] + current[second]) / max_size)
+    n_pairs_odd = _min_halvings((current[first] / 2 + current[second]) / max_size)
+    n_turns = min(2 * n_pairs_even, 2 * n_pairs_odd + 1)
+    n_halvings[first] += (n_turns + 1) // 2
+    n_halvings[second] += n_turns // 2
+
+    return n_halvings
+
+
+def _min_halvings(ratio: float, strict: bool = True) -> int:
+    """Return the smallest number of halvings, n >= 0, of a ratio so
+    that ``ratio / 2**n < 1``, or ``<= 1`` if not ``strict``.
+    """
+    if ratio < 1 or (ratio == 1 and not strict):
+        return 0
+    mantissa, exponent = math.frexp(ratio)  # ratio = mantissa * 2**exponent
+    if mantissa == 0.5 and not strict:
+        return exponent - 1
+    return exponent
+
+
 def _update_learning_results(
     learning_results,
     components: int | list[int] | None,
@@ -308,22 +450,43 @@ def _update_learning_results(
     """
     dtype_out = np.dtype(dtype_out)
 
-    # Change data type
-    factors = learning_results.factors.astype(dtype_out)
-    loadings = learning_results.loadings.astype(dtype_out)
+    factors = learning_results.factors
+    loadings = learning_results.loadings
 
     # Keep desired components
-    if hasattr(components, "__iter__"):  # components is a list of ints
+    if isinstance(components, (list, tuple, range, np.ndarray)):  # List of ints
         factors = factors[:, components]
         loadings = loadings[:, components]
     else:  # components is an int
         factors = factors[:, :components]
         loadings = loadings[:, :components]
 
+    # Change data type of the kept components, only copying if necessary
+    factors = factors.astype(dtype_out, copy=False)
+    loadings = loadings.astype(dtype_out, copy=False)
+
     # Rechunk if learning results are lazy
     if isinstance(factors, da.Array) and isinstance(loadings, da.Array):
-        chunks = _rechunk_learning_results(factors=factors, loadings=loadings)
-        factors = factors.rechunk(chunks=chunks[0])
-        loadings = loadings.rechunk(chunks=chunks[1])
+        chunks = _rechunk_learning_results(
+            factors=factors,
+            loadings=loadings,
+            mbytes_chunk=LEARNING_RESULTS_MBYTES_CHUNK,
+        )
+        # Let Dask rechunk in intermediate stages if the chunk shapes
+        # change a lot, keeping intermediate chunks within the same size
+        block_size_limit = LEARNING_RESULTS_MBYTES_CHUNK * 2**20
+        # Skip rechunking into one chunk if there already is only one
+        if chunks[0] != (-1, -1) or factors.npartitions > 1:
+            factors = factors.rechunk(
+                chunks=chunks[0], block_size_limit=block_size_limit
+            )
+        if chunks[1] != (-1, -1) or loadings.npartitions > 1:
+            loadings = loadings.rechunk(
+                chunks=chunks[1], block_size_limit=block_size_limit
+            )
+        # Fuse the slicing, casting and rechunking into fewer tasks.
+        # Optimize separately so that the graphs are not merged.
+        (factors,) = dask.optimize(factors)
+        (loadings,) = dask.optimize(loadings)
 
     return factors, loadings
@@ -26,12 +26,12 @@ from kikuchipy.io._io import _assign_signal_subclass, _dict2signal
 
 class TestIO:
     @pytest.mark.parametrize("filename", ("im_not_here.h5", "unsupported.h4"))
-    def test_load(self, kikuchipy_h5ebsd_path, tmpdir, filename):
+    def test_load(self, kikuchipy_h5ebsd_signal, tmpdir, filename):
         if filename == "im_not_here.h5":
             with pytest.raises(IOError, match="No filename matches"):
                 _ = kp.load(filename)
         else:
-            s = kp.load(kikuchipy_h5ebsd_path / "patterns.h5")
+            s = kikuchipy_h5ebsd_signal.deepcopy()
             file_path = tmpdir / "supported.h5"
             s.save(file_path)
             new_file_path = tmpdir / filename
@@ -39,6 +39,12 @@ class TestIO:
             with pytest.raises(IOError, match="Could not read"):
                 _ = kp.load(new_file_path)
 
+    def test_load_no_file(self, tmp_path):
+        with pytest.raises(IOError, match="No filename matches"):
+            _ = kp.load(tmp_path / "*.tif")
+        with pytest.raises(IOError, match="Could not read"):
+            _ = kp.load(tmp_path)
+
     def test_dict2signal(self, kikuchipy_h5ebsd_path):
         scan_dict = kp.io.plugins.kikuchipy_h5ebsd.file_reader(
             kikuchipy_h5ebsd_path / "patterns.h5"
@@ -47,56 +53,45 @@ class TestIO:
         with pytest.raises(ValueError, match="kikuchipy only supports"):
             _ = _dict2signal(scan_dict)
 
+    def test_assign_signal_subclass_errors(self):
+        with pytest.raises(ValueError, match="Data type"):
+            _ = _assign_signal_subclass(
+                dtype=np.dtype("complex"),
+                signal_dimension=2,
+                signal_type="EBSD",
+                lazy=True,
+            )
+        with pytest.raises(ValueError, match="Signal dimension must be"):
+            _ = _assign_signal_subclass(
+                dtype=np.dtype("uint8"),
+                signal_dimension=-1,
+                signal_type="EBSD",
+                lazy=False,
+            )
+        with pytest.raises(ValueError, match="No kikuchipy signals match"):
+            _ = _assign_signal_subclass(
+                dtype=np.dtype("uint8"),
+                signal_dimension=2,
+                signal_type="",
+                lazy=False,
+            )
+
     @pytest.mark.parametrize(
-        "dtype, lazy, signal_dimension, signal_type",
-        [
-            (np.dtype("complex"), True, 2, "EBSD"),
-            (np.dtype("uint8"), False, 2, "EBSD"),
-            (np.dtype("uint8"), True, 2, "EBSD"),
-            (np.dtype("uint8"), False, -1, "EBSD"),
-            (np.dtype("uint8"), False, 2, ""),
-        ],
+        "lazy, signal_class",
+        [(False, kp.signals.EBSD), (True, kp.signals.LazyEBSD)],
     )
-    def test_assign_signal_subclass(self, dtype, lazy, signal_dimension, signal_type):
-        if "complex" in dtype.name:
-            with pytest.raises(ValueError, match="Data type"):
-                _ = _assign_signal_subclass(
-                    dtype=dtype,
-                    signal_dimension=signal_dimension,
-                    signal_type=signal_type,
-                    lazy=lazy,
-                )
-        elif not isinstance(signal_dimension, int) or signal_dimension < 0:
-            with pytest.raises(ValueError, match="Signal dimension must be"):
-                _ = _assign_signal_subclass(
-                    dtype=dtype,
-                    signal_dimension=signal_dimension,
-                    signal_type=signal_type,
-                    lazy=lazy,
-                )
-        elif signal_type == "":
-            with pytest.raises(ValueError, match="No kikuchipy signals match"):
-                _ = _assign_signal_subclass(
-                    dtype=dtype,
-                    signal_dimension=signal_dimension,
-                    signal_type=signal_type,
-                    lazy=lazy,
-                )
-        else:
-            signal = _assign_signal_subclass(
-                dtype=dtype,
-                signal_dimension=signal_dimension,
-                signal_type=signal_type,
-                lazy=lazy,
-            )
-            if not lazy:
-                assert signal == kp.signals.EBSD
-            else:
-                assert signal == kp.signals.LazyEBSD
+    def test_assign_signal_subclass_ok(self, lazy, signal_class):
+        signal = _assign_signal_subclass(
+            dtype=np.dtype("uint8"),
+            signal_dimension=2,
+            signal_type="EBSD",
+            lazy=lazy,
+        )
+        assert signal == signal_class
 
     @pytest.mark.parametrize("extension", ("", ".h4"))
-    def test_save_extensions(self, kikuchipy_h5ebsd_path, extension, tmpdir):
-        s = kp.load(kikuchipy_h5ebsd_path / "patterns.h5")
+    def test_save_extensions(self, kikuchipy_h5ebsd_signal, extension, tmpdir):
+        s = kikuchipy_h5ebsd_signal.deepcopy()
         file_path = tmpdir / ("supported" + extension)
         if extension == "":
             s.save(file_path)
@@ -106,14 +101,14 @@ class TestIO:
                 s.save(file_path)
 
     @pytest.mark.filterwarnings("ignore:Using `set_signal_dimension`")
-    def test_save_data_dimensions(self, kikuchipy_h5ebsd_path):
-        s = kp.load(kikuchipy_h5ebsd_path / "patterns.h5")
+    def test_save_data_dimensions(self, kikuchipy_h5ebsd_signal):
+        s = kikuchipy_h5ebsd_signal.deepcopy()
         s.axes_manager.set_signal_dimension(3)
         with pytest.raises(ValueError, match="This file format cannot write"):
             s.save()
 
-    def test_save_to_existing_file(self, save_path_hdf5, kikuchipy_h5ebsd_path):
-        s = kp.load(kikuchipy_h5ebsd_path / "patterns.h5")
+    def test_save_to_existing_file(self, save_path_hdf5, kikuchipy_h5ebsd_signal):
+        s = kikuchipy_h5ebsd_signal.deepcopy()
         s.save(save_path_hdf5)
         with pytest.warns(UserWarning, match="Your terminal does not"):
             s.save(save_path_hdf5, scan_number=2)
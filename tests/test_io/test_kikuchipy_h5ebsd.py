@@ -222,6 +222,10 @@ class TestKikuchipyH5EBSD:
         np.testing.assert_equal(
             s1.metadata.as_dictionary(), s2.metadata.as_dictionary()
         )
+        np.testing.assert_equal(
+            s1.tmp_parameters.as_dictionary(), s2.tmp_parameters.as_dictionary()
+        )
+        assert s2.tmp_parameters.folder == str(kikuchipy_h5ebsd_path)
 
     def test_load_save_lazy(self, kikuchipy_h5ebsd_path, save_path_hdf5):
         s = kp.load(kikuchipy_h5ebsd_path / "patterns.h5", lazy=True)
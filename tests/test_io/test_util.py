@@ -19,9 +19,10 @@ from contextlib import contextmanager
 import io
 import sys
 
+import h5py
 import pytest
 
-from kikuchipy.io._util import _get_input_bool, _get_input_variable
+from kikuchipy.io._util import _get_input_bool, _get_input_variable, _is_hdf5
 
 
 @contextmanager
@@ -60,3 +61,20 @@ class TestIO:
             else:
                 returns = _get_input_variable(question, var_type)
         assert returns == var_type(answer)
+
+    def test_is_hdf5(self, tmp_path):
+        fname = tmp_path / "a.h5"
+        with h5py.File(fname, mode="w") as f:
+            f["a"] = 1
+        assert _is_hdf5(fname)
+
+        fname_userblock = tmp_path / "b.h5"
+        with h5py.File(fname_userblock, mode="w", userblock_size=1024) as f:
+            f["a"] = 1
+        assert _is_hdf5(fname_userblock)
+
+        fname_txt = tmp_path / "c.h5"
+        fname_txt.write_text("Not an HDF5 file")
+        assert not _is_hdf5(fname_txt)
+
+        assert not _is_hdf5(tmp_path / "d.h5")
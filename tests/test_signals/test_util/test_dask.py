@@ -15,13 +15,23 @@
 # You should have received a copy of the GNU General Public License
 # along with kikuchipy. If not, see <http://www.gnu.org/licenses/>.
 
+import math
+
+import dask
 import dask.array as da
+from dask.array.rechunk import plan_rechunk
+from hyperspy.learn.mva import LearningResults
 import numpy as np
 import pytest
 
 import kikuchipy as kp
 from kikuchipy.signals.util._dask import (
+    LEARNING_RESULTS_MBYTES_CHUNK,
+    _get_number_of_halvings,
     _rechunk_learning_results,
+    _reduce_chunks,
+    _snap_chunks,
+    _update_learning_results,
     get_chunking,
     get_dask_array,
 )
@@ -42,6 +52,35 @@ class TestDask:
             dtype=s.data.dtype,
         )
 
+    @pytest.mark.parametrize(
+        "shape, chunk_shape",
+        [
+            ((33, 7, 10, 10), 16),
+            ((5, 10, 10), 16),
+            ((0, 48, 10, 10), 16),
+            ((33, 7, 10, 10), np.int64(16)),
+            ((12, 10, 10), 5.0),
+            ((13, 10, 10), "auto"),
+            ((12, 10, 10), -1),
+            ((12, 10, 10), (4, 8)),
+        ],
+    )
+    def test_chunk_shape_uneven(self, shape, chunk_shape):
+        nav_dim = len(shape) - 2
+        chunks = get_chunking(
+            data_shape=shape,
+            nav_dim=nav_dim,
+            sig_dim=2,
+            chunk_shape=chunk_shape,
+            dtype="uint8",
+        )
+        assert chunks == da.core.normalize_chunks(
+            chunks=(chunk_shape,) * nav_dim + (-1, -1),
+            shape=shape,
+            limit=30e6,
+            dtype=np.dtype("uint8"),
+        )
+
     def test_chunk_bytes(self):
         s = kp.signals.LazyEBSD(da.zeros((32, 32, 256, 256), dtype=np.uint16))
         assert get_chunking(s, chunk_bytes=15e6) == da.core.normalize_chunks(
@@ -89,6 +128,14 @@ class TestDask:
             dtype=dtype,
         )
 
+    def test_get_chunking_dask_config(self):
+        kwargs = dict(data_shape=(32, 32, 256, 256), nav_dim=2, sig_dim=2)
+        chunks1 = get_chunking(chunk_bytes=None, dtype="uint16", **kwargs)
+        with dask.config.set({"array.chunk-size": "10MiB"}):
+            chunks2 = get_chunking(chunk_bytes=None, dtype="uint16", **kwargs)
+        assert chunks1 != chunks2
+        assert chunks2 == get_chunking(chunk_bytes="10MiB", dtype="uint16", **kwargs)
+
     def test_get_dask_array(self):
         s = kp.signals.EBSD((255 * np.random.rand(10, 10, 120, 120)).astype(np.uint8))
         dask_array = get_dask_array(s, chunk_shape=8)
@@ -103,6 +150,10 @@ class TestDask:
         s.data = dask_array.rechunk((5, 5, 120, 120))
         dask_array = get_dask_array(s)
         assert dask_array.chunksize == (5, 5, 120, 120)
+        assert dask_array is s.data
+
+        dask_array2 = get_dask_array(s, dtype="float32")
+        assert dask_array2.dtype == np.float32
 
     def test_chunk_bytes_indirectly(self):
         s = kp.signals.EBSD(np.zeros((10, 10, 8, 8)))
@@ -112,6 +163,45 @@ class TestDask:
         assert array_out0.chunks != array_out1.chunks
         assert array_out1.chunks == array_out2.chunks
 
+        s2 = kp.signals.LazyEBSD(
+            da.zeros((50, 40, 60, 60), dtype="uint8", chunks=(10, 5, 60, 60))
+        )
+        array_out3 = get_dask_array(s2, rechunk=True, chunk_bytes="8MB")
+        array_out4 = get_dask_array(s2, rechunk=True, chunk_bytes=8e6)
+        assert array_out3.chunks == array_out4.chunks
+
+    def test_reduce_chunks_snapped(self):
+        s = kp.signals.LazyEBSD(
+            da.zeros((50, 40, 60, 60), dtype="uint8", chunks=(3, 7, 60, 60))
+        )
+        dask_array = get_dask_array(s, rechunk=True, chunk_bytes="8MB")
+        for new_chunks, old_size in zip(dask_array.chunks[:2], (3, 7)):
+            assert all(c % old_size == 0 for c in new_chunks[:-1])
+
+        # Snapping does not split an axis which fits in one chunk
+        assert _reduce_chunks(s.data, chunk_bytes=100e6)[1] == (40,)
+        dask_array2 = da.zeros((10, 10, 60, 60), dtype="uint8", chunks=(3, 3, 60, 60))
+        chunks2 = _reduce_chunks(dask_array2, chunk_bytes=8e6)
+        assert dask_array2.rechunk(chunks2).npartitions == 4
+
+    @pytest.mark.parametrize(
+        "chunks, old_chunks, desired_chunks",
+        [
+            ((8, 8, 4), (3, 3, 3, 3, 3, 3, 2), (6, 6, 8)),
+            ((7, 7, 6), (2,) * 10, (7, 7, 6)),
+            ((7, 7, 7, 2), (2,) * 11 + (1,), (6, 6, 6, 5)),
+            ((10, 10), (3, 3, 3, 3, 3, 3, 2), (10, 10)),
+            ((4, 4, 4, 4, 4), (5, 5, 5, 5), (4, 4, 4, 4, 4)),
+            ((10, 10), (4, 3, 4, 4, 5), (10, 10)),
+            ((20,), (5, 5, 5, 5), (20,)),
+            ((10, 7), (5, 5, 7), (10, 7)),
+            ((10,), (3, 3, 3, 1), (10,)),
+            ((40,), (7,) * 5 + (5,), (40,)),
+        ],
+    )
+    def test_snap_chunks(self, chunks, old_chunks, desired_chunks):
+        assert _snap_chunks(chunks, old_chunks) == desired_chunks
+
     def test_rechunk_learning_results(self):
         data = da.from_array(np.random.rand(10, 100, 100, 5).astype(np.float32))
         lazy_signal = kp.signals.LazyEBSD(data)
@@ -125,6 +215,10 @@ class TestDask:
         with pytest.raises(ValueError, match="The last dimensions in factors"):
             _ = _rechunk_learning_results(factors=factors, loadings=loadings.T)
 
+        # No chunking necessary
+        chunks = _rechunk_learning_results(factors=factors, loadings=loadings)
+        assert chunks == [(-1, -1), (-1, -1)]
+
         # Only chunk first axis in loadings
         chunks = _rechunk_learning_results(
             factors=factors, loadings=loadings, mbytes_chunk=0.02
@@ -140,3 +234,92 @@ class TestDask:
         assert chunks[0] == (125, -1)
         assert chunks[1][0] in [125, 62]
         assert chunks[1][1] == -1
+
+        # Factors and loadings halved 2 and 5 times give 5 and 33
+        # chunks, not the 5 and 17 chunks from the halving loop
+        chunks = _rechunk_learning_results(
+            factors=np.zeros((32217, 1), dtype="uint8"),
+            loadings=np.zeros((206677, 1), dtype="uint8"),
+            mbytes_chunk=0.02,
+        )
+        assert chunks == [(32217 // 5, -1), (206677 // 33, -1)]
+
+    def test_update_learning_results_lazy(self):
+        rng = np.random.default_rng()
+        learning_results = LearningResults()
+        learning_results.factors = da.from_array(
+            rng.random((1000, 20)), chunks=(100, 20)
+        )
+        learning_results.loadings = da.from_array(
+            rng.random((2000, 20)), chunks=(100, 20)
+        )
+        factors, loadings = _update_learning_results(
+            learning_results, components=10, dtype_out="float32"
+        )
+
+        for arr_in, arr_out in [
+            (learning_results.factors, factors),
+            (learning_results.loadings, loadings),
+        ]:
+            arr_ref = arr_in[:, :10].astype("float32").rechunk((-1, -1))
+            # Fewer tasks, and the factors and loadings graphs are kept
+            # separate
+            assert len(arr_out.dask) < len(arr_ref.dask)
+            assert arr_out.npartitions == 1
+            assert arr_out.dtype == np.float32
+            assert np.array_equal(arr_out.compute(), arr_ref.compute())
+
+    def test_update_learning_results_staged_rechunk(self):
+        # Factors are chunked along the component axis, while they are
+        # rechunked along the detector pixel axis
+        learning_results = LearningResults()
+        learning_results.factors = da.zeros(
+            (2**21, 100), dtype="float32", chunks=(-1, 1)
+        )
+        learning_results.loadings = da.zeros(
+            (2**18, 100), dtype="float32", chunks=(-1, 1)
+        )
+        factors, _ = _update_learning_results(
+            learning_results, components=100, dtype_out="float32"
+        )
+        assert factors.chunks[0][0] == 2**16
+        assert factors.chunks[1] == (100,)
+
+        # Intermediate chunks are within the learning results chunk
+        # size, which they are not with Dask's default limit
+        block_size_limit = LEARNING_RESULTS_MBYTES_CHUNK * 2**20
+        old_chunks = learning_results.factors.chunks
+        for limit, fits in [(block_size_limit, True), (None, False)]:
+            stages = plan_rechunk(old_chunks, factors.chunks, 4, block_size_limit=limit)
+            assert len(stages) > 1
+            max_block_size = max(
+                math.prod(max(c) for c in stage) * 4 for stage in stages[:-1]
+            )
+            assert (max_block_size <= block_size_limit) == fits
+
+        # The staged rechunk with the limit is used
+        factors_limit = learning_results.factors.rechunk(
+            factors.chunks, block_size_limit=block_size_limit
+        )
+        factors_default = learning_results.factors.rechunk(factors.chunks)
+        assert len(factors_limit.dask) != len(factors_default.dask)
+        assert len(factors.dask) == len(dask.optimize(factors_limit)[0].dask)
+
+    @pytest.mark.parametrize(
+        "sizes, max_size, desired_n_halvings",
+        [
+            ([20000, 40000], 10485.76, [2, 3]),
+            ([2**20, 2**20], 2**20, [2, 1]),
+            ([1e9, 1e3], 2**20, [10, 0]),
+            ([1e3, 1e9], 2**20, [0, 10]),
+            ([3e8, 1e8], 10 * 2**20, [6, 5]),
+            # Halving without rounding down gives one more halving of
+            # the loadings than a loop of floor divisions by two did
+            # ([2, 4]), since 32217 / 4 + 206677 / 16 > 20971.52
+            ([32217, 206677], 20971.52, [2, 5]),
+        ],
+    )
+    def test_get_number_of_halvings(self, sizes, max_size, desired_n_halvings):
+        n_halvings = _get_number_of_halvings(sizes, max_size)
+        assert n_halvings == desired_n_halvings
+        assert sizes[0] / 2 ** n_halvings[0] + sizes[1] / 2 ** n_halvings[1] < max_size
@@ -42,6 +42,10 @@ class TestDeprecationWarning:
             "`bar()` instead."
         )
         assert str(record[0].message) == desired_msg
+        # Warns only once
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert foo(5) == 6
         assert foo.__doc__ == (
             "[*Deprecated*] Some docstring.\n"
             "\nNotes\n-----\n"
@@ -112,6 +116,21 @@ class TestDeprecationWarning:
             f"   {desired_msg}"
         )
 
+    def test_deprecation_ignored_not_wrapped(self):
+        def foo(n):
+            """Some docstring."""
+            return n + 1
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", np.VisibleDeprecationWarning)
+            foo2 = deprecated(since=0.7)(foo)
+
+        assert foo2 is foo
+        assert foo2.__doc__.startswith("[*Deprecated*] Some docstring.")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert foo2(4) == 5
+
 
 class TestDeprecateArgument:
     def test_deprecate_argument(self):
@@ -145,6 +164,11 @@ class TestDeprecateArgument:
             r"`bar_arg()` for more details."
         )
 
+        # Warns only once
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert my_foo.bar_arg(a=2) == {"a": 2}
+
         # Warns with alternative
         with pytest.warns(np.VisibleDeprecationWarning) as record3:
             assert my_foo.bar_arg_alt(a=3) == {"a": 3}
@@ -153,3 +177,13 @@ class TestDeprecateArgument:
             r"To avoid this warning, please do not use `a`. Use `b` instead. See the "
             r"documentation of `bar_arg_alt()` for more details."
         )
+
+    def test_deprecate_argument_ignored_not_wrapped(self):
+        def bar(**kwargs):
+            return kwargs
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", np.VisibleDeprecationWarning)
+            bar2 = deprecated_argument(name="a", since="1.3", removal="1.4")(bar)
+
+        assert bar2 is bar